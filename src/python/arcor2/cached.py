@@ -103,6 +103,9 @@ class CachedScene(CachedBase):
     def object_ids(self) -> set[str]:
         return set(self._objects)
 
+    def has_object(self, object_id: str) -> bool:
+        return object_id in self._objects
+
     def object(self, object_id: str) -> cmn.SceneObject:
         try:
             return self._objects[object_id]
@@ -379,6 +382,11 @@ class CachedProject(CachedBase):
 
         return value.ap, value.joints
 
+    @property
+    def aps_and_joints(self) -> Iterator[tuple[cmn.BareActionPoint, cmn.ProjectRobotJoints]]:
+        for value in self._joints.values():
+            yield value.ap, value.joints
+
     def joints(self, joints_id: str) -> cmn.ProjectRobotJoints:
         try:
             return self._joints[joints_id].joints
@@ -464,11 +464,20 @@ class Action(BareAction):
     flows: list[Flow] = field(default_factory=list)
 
     def parse_type(self) -> ParsedType:
+        # the result is cached together with the type it was parsed from, as the type might be changed
+        # (it is not a dataclass field, so it does not get serialized)
+        cached: None | tuple[str, Action.ParsedType] = self.__dict__.get("_parsed_type")
+        if cached is not None and cached[0] == self.type:
+            return cached[1]
+
         try:
             obj_id_str, action = self.type.split("/")
         except ValueError:
             raise Arcor2Exception(f"Action: {self.id} has invalid type: {self.type}.")
-        return self.ParsedType(obj_id_str, action)
+
+        parsed = self.ParsedType(obj_id_str, action)
+        self.__dict__["_parsed_type"] = self.type, parsed
+        return parsed
 
     def parameter(self, parameter_id: str) -> ActionParameter:
         for param in self.parameters:
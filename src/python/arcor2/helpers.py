@@ -133,11 +133,15 @@ def import_type_def(type_name: str, output_type: type[T], path: str, module_name
 
     importlib.invalidate_caches()  # otherwise import might fail randomly (not sure why exactly)
 
-    try:
-        module = importlib.import_module(f"{module_name}.{type_file}")
+    full_module_name = f"{module_name}.{type_file}"
 
-        # reload is necessary for cases when the module is already loaded
-        module = importlib.reload(module)  # TODO does this really solve anything?
+    try:
+        if full_module_name in sys.modules:
+            # reload is necessary for cases when the module is already loaded
+            module = importlib.reload(sys.modules[full_module_name])  # TODO does this really solve anything?
+        else:
+            # fresh import executes the module, there is no need to reload it right away (and execute it again)
+            module = importlib.import_module(full_module_name)
 
     except ImportError as e:
         raise ImportClsException(f"Failed to import '{module_name}.{type_file}'. {str(e).capitalize()}.") from e
@@ -3,6 +3,7 @@ import inspect
 import os
 import shutil
 from dataclasses import is_dataclass
+from functools import lru_cache
 from typing import Any, Callable, Iterator, get_type_hints
 
 import typing_inspect
@@ -72,8 +73,18 @@ def get_built_in_type(name: str) -> type[Generic]:
     raise KeyError
 
 
-def built_in_types_names() -> set[str]:
-    return {type_name for type_name, _ in built_in_types()}
+_built_in_types_names: None | frozenset[str] = None
+
+
+def built_in_types_names() -> frozenset[str]:
+    """Names of built-in types never change, so they are gathered just once."""
+
+    global _built_in_types_names
+
+    if _built_in_types_names is None:
+        _built_in_types_names = frozenset(type_name for type_name, _ in built_in_types())
+
+    return _built_in_types_names
 
 
 class DataError(Arcor2Exception):
@@ -83,6 +94,14 @@ class DataError(Arcor2Exception):
 # TODO settings_to_params
 
 
+@lru_cache(maxsize=128)
+def _settings_def_and_type_hints(type_def: type[Generic]) -> tuple[type[Settings], dict[str, Any]]:
+    """Resolving type hints is quite expensive, so it is done once per type."""
+
+    settings_def = get_settings_def(type_def)
+    return settings_def, get_type_hints(settings_def.__init__)
+
+
 def settings_from_params(
     type_def: type[Generic], settings: list[Parameter], overrides: None | list[Parameter] = None
 ) -> Settings:
@@ -108,11 +127,9 @@ def settings_from_params(
 
         final[over.name] = over
 
-    settings_def = get_settings_def(type_def)
+    settings_def, settings_def_type_hints = _settings_def_and_type_hints(type_def)
     settings_data: dict[str, Any] = {}
 
-    settings_def_type_hints = get_type_hints(settings_def.__init__)
-
     for s in final.values():
         try:
             setting_def = settings_def_type_hints[s.name]
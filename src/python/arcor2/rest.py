@@ -291,8 +291,8 @@ def call(
     logger.debug(f"Response text: {resp.text}")
 
     try:
-        resp_json = resp.json()
-    except ValueError as e:
+        resp_json: Any = json.loads(resp.content)
+    except json.JsonException as e:
         logger.debug(f"Got invalid JSON in the response: {resp.text}")
         raise RestException("Invalid JSON.") from e
 
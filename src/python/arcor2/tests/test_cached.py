@@ -1,5 +1,5 @@
 from arcor2.cached import CachedProject, CachedScene, UpdateableCachedProject, UpdateableCachedScene
-from arcor2.data.common import Project, Scene
+from arcor2.data.common import Project, Scene, SceneObject
 
 
 def test_slots() -> None:
@@ -12,3 +12,18 @@ def test_slots() -> None:
     assert not hasattr(CachedProject(p), "__dict__")
     assert not hasattr(UpdateableCachedScene(s), "__dict__")
     assert not hasattr(UpdateableCachedProject(p), "__dict__")
+
+
+def test_object_ids() -> None:
+    s = UpdateableCachedScene(Scene("", objects=[SceneObject("obj", "Type")]))
+    obj_id = s.scene.objects[0].id
+
+    assert s.has_object(obj_id)
+    assert not s.has_object(s.id)
+
+    # object_ids is a snapshot, the scene might be modified while iterating over it
+    for object_id in s.object_ids:
+        s.delete_object(object_id)
+
+    assert not s.object_ids
+    assert not s.has_object(obj_id)
@@ -1,3 +1,5 @@
+import os
+import sys
 from contextlib import nullcontext as does_not_raise
 
 import pytest
@@ -33,3 +35,26 @@ from arcor2.exceptions import Arcor2Exception
 def test_is_valid_identifier(val, expectation) -> None:
     with expectation:
         hlp.is_valid_identifier(val)
+
+
+def test_save_and_import_type_def(tmp_path, capsys, monkeypatch) -> None:
+    module_name = "arcor2_test_types"
+
+    # sys.path and sys.modules are restored afterwards, so repeated runs import the module from their own tmp_path
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, module_name, raising=False)
+    monkeypatch.delitem(sys.modules, f"{module_name}.test_type", raising=False)
+
+    os.makedirs(os.path.join(tmp_path, module_name))
+    open(os.path.join(tmp_path, module_name, "__init__.py"), "w").close()
+
+    source = 'print("executed")\n\n\nclass TestType:\n    pass\n'
+
+    cls = hlp.save_and_import_type_def(source, "TestType", object, str(tmp_path), module_name)
+    assert cls.__name__ == "TestType"
+    assert capsys.readouterr().out == "executed\n"  # fresh import executes the module just once
+    assert str(sys.modules[f"{module_name}.test_type"].__file__).startswith(str(tmp_path))
+
+    cls2 = hlp.save_and_import_type_def(source, "TestType", object, str(tmp_path), module_name)
+    assert cls2 is not cls  # module was reloaded
+    assert capsys.readouterr().out == "executed\n"
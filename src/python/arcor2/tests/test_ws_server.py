@@ -0,0 +1,52 @@
+import asyncio
+import socket
+from typing import AsyncIterator
+
+import pytest
+import pytest_asyncio
+import websockets
+import websockets.client
+from websockets.server import WebSocketServerProtocol as WsClient
+
+from arcor2.helpers import find_free_port
+from arcor2.ws_server import ClientWriter
+
+MESSAGES = [str(idx) * idx for idx in range(100)]
+
+
+@pytest_asyncio.fixture()
+async def uri() -> AsyncIterator[str]:
+    async def handler(client: WsClient) -> None:
+        maxsize, repeat = (int(val) for val in client.path.strip("/").split("/"))
+
+        # small send buffer, so the messages can't be written right away and have to be queued
+        client.transport.get_extra_info("socket").setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4096)
+        writer = ClientWriter(client, maxsize)
+
+        for msg in MESSAGES:
+            writer.put(msg * repeat)
+
+        await client.wait_closed()
+        writer.stop()
+
+    port = find_free_port()
+
+    async with websockets.server.serve(handler, "127.0.0.1", port):
+        yield f"ws://127.0.0.1:{port}"
+
+
+@pytest.mark.asyncio()
+async def test_client_writer_order(uri: str) -> None:
+    async with websockets.client.connect(f"{uri}/{len(MESSAGES)}/1") as ws:
+        assert [await asyncio.wait_for(ws.recv(), 1.0) for _ in MESSAGES] == MESSAGES
+
+
+@pytest.mark.asyncio()
+async def test_client_writer_slow_client(uri: str) -> None:
+    async with websockets.client.connect(f"{uri}/2/1000", max_size=None) as ws:
+        with pytest.raises(websockets.exceptions.ConnectionClosed) as e:
+            while True:
+                await asyncio.wait_for(ws.recv(), 1.0)
+
+        assert e.value.rcvd
+        assert e.value.rcvd.code == 1013
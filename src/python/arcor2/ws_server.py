@@ -1,11 +1,12 @@
 import asyncio
 import time
 from collections import deque
-from typing import Any, Awaitable, Callable, Coroutine, TypeVar
+from typing import Any, Awaitable, Callable, Coroutine, Iterable, TypeVar
 
 import websockets
 from aiologger.levels import LogLevel
 from dataclasses_jsonschema import ValidationError
+from websockets.legacy.protocol import broadcast
 from websockets.server import WebSocketServerProtocol as WsClient
 
 from arcor2 import env, json
@@ -14,13 +15,15 @@ from arcor2.data.rpc.common import RPC
 from arcor2.exceptions import Arcor2Exception
 
 MAX_RPC_DURATION = env.get_float("ARCOR2_MAX_RPC_DURATION", 0.1)
+CLIENT_QUEUE_SIZE = env.get_int("ARCOR2_CLIENT_QUEUE_SIZE", 256)
+MAX_BATCH_SIZE = 2**16  # bytes written to a client before waiting for the write buffer to drain
 
 RPCT = TypeVar("RPCT", bound=RPC)
 ReqT = TypeVar("ReqT", bound=RPC.Request)
 RespT = TypeVar("RespT", bound=RPC.Response)
 
 RPC_CB = Callable[[ReqT, WsClient], Coroutine[Any, Any, None | RespT]]
-RPC_DICT_TYPE = dict[str, tuple[type[RPC], RPC_CB]]
+RPC_DICT_TYPE = dict[str, tuple[type[RPC], RPC_CB]]  # RPC name (the key) has to match RPC class name
 
 EventT = TypeVar("EventT", bound=Event)
 EVENT_DICT_TYPE = dict[str, tuple[type[EventT], Callable[[EventT, WsClient], Coroutine[Any, Any, None]]]]
@@ -41,6 +44,78 @@ async def send_json_to_client(client: WsClient, data: str) -> None:
         pass
 
 
+def send_json_to_clients(clients: Iterable[WsClient], data: str) -> None:
+    """Writes an already serialized message to all the clients.
+
+    No task is created per client and the clients are not waited for (no drain).
+    A failure of one client does not affect the others.
+    """
+
+    broadcast(clients, data)
+
+
+class ClientWriter:
+    """Sends messages to a client from a dedicated task.
+
+    Queueing a message is cheap and the order of messages is preserved.
+    When nothing is pending and the client keeps up, the message is written
+    right away, without waking up the task.
+    Pending messages are written in batches (still one message per frame).
+    A client that can't keep up (its queue gets full) is disconnected.
+    """
+
+    __slots__ = ("client", "_queue", "_task", "_closing")
+
+    def __init__(self, client: WsClient, maxsize: int = CLIENT_QUEUE_SIZE) -> None:
+        self.client = client
+        self._queue: asyncio.Queue[str] = asyncio.Queue(maxsize)
+        self._task = asyncio.create_task(self._writer())
+        self._closing = False
+
+    def put(self, data: str) -> None:
+        if self._closing or self._task.done():
+            return
+
+        # messages are written right after being taken from the queue, so if it is empty, nothing is pending
+        if self._queue.empty() and self.client.open and not self.client.transport.get_write_buffer_size():
+            broadcast((self.client,), data)
+            return
+
+        try:
+            self._queue.put_nowait(data)
+        except asyncio.QueueFull:
+            self._closing = True
+            self._task.cancel()
+            self._task = asyncio.create_task(self.client.close(1013, "Too many pending messages."))
+
+    def stop(self) -> None:
+        self._task.cancel()
+
+    async def _writer(self) -> None:
+        client = self.client
+        queue = self._queue
+
+        while True:
+            data = await queue.get()
+
+            if not client.open:
+                return
+
+            # messages that are already pending are written at once, flow control is handled once per batch
+            broadcast((client,), data)
+            batch_size = len(data)
+
+            while batch_size < MAX_BATCH_SIZE and not queue.empty():
+                data = queue.get_nowait()
+                broadcast((client,), data)
+                batch_size += len(data)
+
+            try:
+                await client.drain()
+            except websockets.exceptions.ConnectionClosed:
+                return
+
+
 async def server(
     client: Any,
     logger: Any,
@@ -49,7 +124,21 @@ async def server(
     rpc_dict: RPC_DICT_TYPE,
     event_dict: None | EVENT_DICT_TYPE = None,
     verbose: bool = False,
+    send: None | Callable[[WsClient, str], None] = None,
 ) -> None:
+    """Handles messages from a client.
+
+    If send is given, responses to RPCs are passed to it instead of being
+    written to the client directly (e.g. to keep them in order with events
+    queued for the client).
+    """
+
+    async def send_response(data: str) -> None:
+        if send is None:
+            await client.send(data)
+        else:
+            send(client, data)
+
     async def handle_message(msg: str) -> None:
         try:
             data = json.loads(msg)
@@ -71,8 +160,6 @@ async def server(
                 logger.error(f"Unknown RPC request: {data}.")
                 return
 
-            assert req_type == rpc_cls.__name__
-
             try:
                 req = rpc_cls.Request.from_dict(data)
             except ValidationError as e:
@@ -81,7 +168,7 @@ async def server(
             except Arcor2Exception as e:
                 # this might happen if e.g. some dataclass does additional validation of values in its __post_init__
                 try:
-                    await client.send(rpc_cls.Response(data["id"], False, messages=[str(e)]).to_json())
+                    await send_response(rpc_cls.Response(data["id"], False, messages=[str(e)]).to_json())
                     logger.debug(e, exc_info=True)
                 except (KeyError, websockets.exceptions.ConnectionClosed):
                     pass
@@ -106,7 +193,7 @@ async def server(
                         resp.id = req.id
 
             try:
-                await client.send(resp.to_json())
+                await send_response(resp.to_json())
             except websockets.exceptions.ConnectionClosed:
                 return
 
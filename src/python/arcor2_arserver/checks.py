@@ -12,6 +12,7 @@ from arcor2.data.common import (
 from arcor2.exceptions import Arcor2Exception
 from arcor2.logic import LogicContainer
 from arcor2.parameter_plugins import ParameterPluginException
+from arcor2.parameter_plugins.base import TypesDict
 from arcor2.parameter_plugins.utils import known_parameter_types, plugin_from_type_name
 from arcor2_arserver.object_types.data import ObjectTypeData, ObjectTypeDict
 from arcor2_arserver.objects_actions import get_types_dict
@@ -184,7 +185,7 @@ def check_object(obj_types: ObjectTypeDict, scene: CachedScene, obj: SceneObject
         raise Arcor2Exception(f"ObjectType {obj.type} is abstract.")
 
     if new_one:
-        if obj.id in scene.object_ids:
+        if scene.has_object(obj.id):
             raise Arcor2Exception(f"Object {obj.name} has duplicate id.")
 
         if obj.name in scene.object_names():
@@ -194,8 +195,19 @@ def check_object(obj_types: ObjectTypeDict, scene: CachedScene, obj: SceneObject
 
 
 def check_action_params(
-    obj_types: ObjectTypeDict, scene: CachedScene, project: CachedProject, action: Action, object_action: ObjectAction
+    obj_types: ObjectTypeDict,
+    scene: CachedScene,
+    project: CachedProject,
+    action: Action,
+    object_action: ObjectAction,
+    types_dict: None | TypesDict = None,
 ) -> None:
+    """Raises exception if parameters of the action are not valid.
+
+    types_dict might be provided when checking more actions at once,
+    otherwise it is created on demand.
+    """
+
     _, action_type = action.parse_type()
 
     assert action_type == object_action.name
@@ -244,10 +256,11 @@ def check_action_params(
             if param.type not in known_parameter_types():
                 raise Arcor2Exception(f"Parameter {param.name} of action {action.name} has unknown type: {param.type}.")
 
+            if types_dict is None:
+                types_dict = get_types_dict(obj_types)
+
             try:
-                plugin_from_type_name(param.type).parameter_value(
-                    get_types_dict(), scene, project, action.id, param.name
-                )
+                plugin_from_type_name(param.type).parameter_value(types_dict, scene, project, action.id, param.name)
             except ParameterPluginException as e:
                 raise Arcor2Exception(f"Parameter {param.name} of action {action.name} has invalid value. {str(e)}")
 
@@ -300,7 +313,7 @@ def check_ap_parent(scene: CachedScene, proj: CachedProject, parent: None | str)
     if not parent:
         return
 
-    if parent in scene.object_ids:
+    if scene.has_object(parent):
         if scene.object(parent).pose is None:
             raise Arcor2Exception("AP can't have object without pose as parent.")
     elif parent not in proj.action_points_ids:
@@ -319,43 +332,47 @@ def project_problems(obj_types: ObjectTypeDict, scene: CachedScene, project: Cac
         except Arcor2Exception as e:
             problems.append(str(e))
 
+    scene_object_ids = scene.object_ids
+    types_dict = get_types_dict(obj_types)  # to not create it for each action parameter
+
     for ap in project.action_points:
         try:
             check_ap_parent(scene, project, ap.parent)
         except Arcor2Exception:
             problems.append(f"Action point {ap.name} has invalid parent: {ap.parent}.")
 
-        for joints in project.ap_joints(ap.id):
-            if joints.robot_id not in scene.object_ids:
-                problems.append(
-                    f"Action point {ap.name} has joints ({joints.name}) for an unknown robot: {joints.robot_id}."
-                )
+    # one pass through all joints instead of searching joints for each AP
+    for ap, joints in project.aps_and_joints:
+        if joints.robot_id not in scene_object_ids:
+            problems.append(
+                f"Action point {ap.name} has joints ({joints.name}) for an unknown robot: {joints.robot_id}."
+            )
 
-        for action in project.actions:
-            # check if objects have used actions
-            obj_id, action_type = action.parse_type()
+    for action in project.actions:
+        # check if objects have used actions
+        obj_id, action_type = action.parse_type()
 
-            if obj_id not in scene.object_ids:
-                problems.append(f"Object ID {obj_id} which action is used in {action.name} does not exist in scene.")
-                continue
+        if obj_id not in scene_object_ids:
+            problems.append(f"Object ID {obj_id} which action is used in {action.name} does not exist in scene.")
+            continue
 
-            scene_obj = scene.object(obj_id)
-            if action_type not in obj_types[scene_obj.type].actions:
-                problems.append(
-                    f"ObjectType {scene_obj.type} does not have action {action_type} used in {action.name}."
-                )
-                continue
+        scene_obj = scene.object(obj_id)
+        obj_type_actions = obj_types[scene_obj.type].actions
 
-            action_meta = obj_types[scene_obj.type].actions[action_type]
+        try:
+            action_meta = obj_type_actions[action_type]
+        except KeyError:
+            problems.append(f"ObjectType {scene_obj.type} does not have action {action_type} used in {action.name}.")
+            continue
 
-            try:
-                check_action_params(obj_types, scene, project, action, action_meta)
-            except Arcor2Exception as e:
-                problems.append(str(e))
+        try:
+            check_action_params(obj_types, scene, project, action, action_meta, types_dict)
+        except Arcor2Exception as e:
+            problems.append(str(e))
 
-            try:
-                check_flows(project, action, action_meta)
-            except Arcor2Exception as e:
-                problems.append(str(e))
+        try:
+            check_flows(project, action, action_meta)
+        except Arcor2Exception as e:
+            problems.append(str(e))
 
     return problems
@@ -140,23 +140,24 @@ async def get_object_type_iddesc(object_type_id: str) -> IdDesc:
 
 async def get_project(project_id: str) -> CachedProject:
     async with _projects_list_lock:
-        try:
-            project = _projects[project_id]
+        project = _projects.get(project_id)
+
+        if project is not None:
             assert project.modified
-        except KeyError:
-            project = CachedProject(await ps.get_project(project_id))
-            _projects[project_id] = project
-        else:
+
             await _update_list(ps.get_projects, _projects_list, _projects)
 
             if project_id not in _projects_list.listing:
                 _projects.pop(project_id, None)
                 raise Arcor2Exception("Project removed externally.")
 
-            # project in cache is outdated
-            if project.modified < _projects_list.listing[project_id].modified:
-                project = CachedProject(await ps.get_project(project_id))
-                _projects[project_id] = project
+            # project in cache is up to date
+            if project.modified >= _projects_list.listing[project_id].modified:
+                return project
+
+    # the lock is not held while downloading, so more projects can be downloaded in parallel
+    project = CachedProject(await ps.get_project(project_id))
+    _projects[project_id] = project
 
     return project
 
@@ -186,23 +187,24 @@ async def get_scene(scene_id: str) -> CachedScene:
 
 async def get_object_type(object_type_id: str) -> ObjectType:
     async with _object_type_lock:
-        try:
-            ot = _object_types[object_type_id]
+        ot = _object_types.get(object_type_id)
+
+        if ot is not None:
             assert ot.modified
-        except KeyError:
-            ot = await ps.get_object_type(object_type_id)
-            _object_types[object_type_id] = ot
-        else:
+
             await _update_list(ps.get_object_type_ids, _object_type_list, _object_types)
 
             if object_type_id not in _object_type_list.listing:
                 _object_types.pop(object_type_id, None)
                 raise Arcor2Exception("ObjectType removed externally.")
 
-            # ObjectType in cache is outdated
-            if ot.modified < _object_type_list.listing[object_type_id].modified:
-                ot = await ps.get_object_type(object_type_id)
-                _object_types[object_type_id] = ot
+            # ObjectType in cache is up to date
+            if ot.modified >= _object_type_list.listing[object_type_id].modified:
+                return ot
+
+    # the lock is not held while downloading, so more ObjectTypes can be downloaded in parallel
+    ot = await ps.get_object_type(object_type_id)
+    _object_types[object_type_id] = ot
 
     return ot
 
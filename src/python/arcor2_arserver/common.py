@@ -1,9 +1,11 @@
-from typing import AsyncIterator
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime
+from typing import AsyncIterator, Callable
 
 from arcor2.cached import CachedProject, UpdateableCachedProject
-from arcor2.data import common
 from arcor2_arserver import globals as glob
-from arcor2_arserver import logger
+from arcor2_arserver import logger, settings
 from arcor2_arserver.clients import project_service as storage
 
 
@@ -16,7 +18,7 @@ async def project_names() -> set[str]:
 
 
 async def associated_projects(scene_id: str) -> set[str]:
-    return {project.id async for project in projects(scene_id)}
+    return set(await _project_ids(scene_id, lambda po: True))
 
 
 async def remove_object_references_from_projects(obj_id: str) -> None:
@@ -24,11 +26,13 @@ async def remove_object_references_from_projects(obj_id: str) -> None:
 
     updated_project_ids: set[str] = set()
 
-    async for project in projects_using_object_as_parent(glob.LOCK.scene.id, obj_id):
+    async for project in projects_referencing_object(glob.LOCK.scene.id, obj_id):
         # action_ids: set[str] = set()
 
         # delete actions using the object
-        for action_to_delete in {act.id for act in project.actions if act.parse_type()[0] == obj_id}:
+        actions_to_delete = {act.id for act in project.actions if act.parse_type()[0] == obj_id}
+
+        for action_to_delete in actions_to_delete:
             project.remove_action(action_to_delete)
 
         # delete actions using obj's action points as parameters
@@ -49,67 +53,124 @@ async def remove_object_references_from_projects(obj_id: str) -> None:
 
         # TODO remove invalid logic items
 
+        if not actions_to_delete:  # there is nothing to be saved
+            continue
+
         await storage.update_project(project)
         updated_project_ids.add(project.id)
 
     logger.info("Updated projects: {}".format(updated_project_ids))
 
 
-async def projects(scene_id: str) -> AsyncIterator[UpdateableCachedProject]:
-    for project_meta in await storage.get_projects():
-        project = await storage.get_project(project_meta.id)
+@dataclass
+class _ProjectObjects:
+    __slots__ = "modified", "scene_id", "parents", "actions"
 
-        if project.scene_id != scene_id:
-            continue
+    modified: None | datetime
+    scene_id: str
+    parents: set[str]  # objects used as parents of action points
+    actions: set[str]  # objects whose actions are used in the project
+
+
+# project ID -> objects used by the project, an entry is valid as long as the project is not modified
+_project_objects: dict[str, _ProjectObjects] = {}
+
+_ProjectPredicate = Callable[[_ProjectObjects], bool]
 
-        yield UpdateableCachedProject(project)
 
+def _index_project(project: CachedProject) -> _ProjectObjects:
+    po = _ProjectObjects(
+        project.modified,
+        project.scene_id,
+        {ap.parent for ap in project.action_points if ap.parent},
+        {action.parse_type()[0] for action in project.actions},
+    )
+    _project_objects[project.id] = po
+    return po
 
-def _project_using_object_as_parent(project: CachedProject, obj_id: str) -> bool:
-    for ap in project.action_points:
-        if ap.parent == obj_id:
-            return True
 
-    return False
+async def _download_projects(project_ids: list[str]) -> list[CachedProject]:
+    """Gets projects in parallel."""
 
+    semaphore = asyncio.Semaphore(settings.MAX_PARALLEL_DOWNLOADS)
+
+    async def _download(project_id: str) -> CachedProject:
+        async with semaphore:
+            return await storage.get_project(project_id)
+
+    return await asyncio.gather(*[_download(project_id) for project_id in project_ids])
+
+
+async def _project_ids(scene_id: str, predicate: _ProjectPredicate) -> list[str]:
+    """Uses the index to find projects of the scene satisfying the predicate.
+
+    Only projects which are new or were modified since the last time are downloaded.
+    """
 
-def _project_referencing_object(project: CachedProject, obj_id: str) -> bool:
-    for action in project.actions:
-        action_obj_id, _ = action.parse_type()
+    listing = await storage.get_projects()
 
-        if action_obj_id == obj_id:
-            return True
+    for removed in _project_objects.keys() - {project_meta.id for project_meta in listing}:
+        del _project_objects[removed]
 
-    return False
+    outdated: list[str] = []
+
+    for project_meta in listing:
+        po = _project_objects.get(project_meta.id)
+
+        if po is None or po.modified != project_meta.modified:
+            outdated.append(project_meta.id)
+
+    for project in await _download_projects(outdated):
+        _index_project(project)
+
+    ret: list[str] = []
+
+    for project_meta in listing:
+        po = _project_objects.get(project_meta.id)
+
+        if po is not None and po.scene_id == scene_id and predicate(po):
+            ret.append(project_meta.id)
+
+    return ret
+
+
+async def _projects(scene_id: str, predicate: _ProjectPredicate) -> AsyncIterator[UpdateableCachedProject]:
+    for project in await _download_projects(await _project_ids(scene_id, predicate)):
+        po = _project_objects.get(project.id)
+
+        # the project might have been modified in the meantime
+        if po is None or po.modified != project.modified:
+            po = _index_project(project)
+
+        if predicate(po):
+            yield UpdateableCachedProject(project)
 
 
 async def projects_using_object(scene_id: str, obj_id: str) -> AsyncIterator[UpdateableCachedProject]:
-    """Combines functionality of projects_using_object_as_parent and
-    projects_referencing_object.
+    """Projects using the object as a parent of an action point or using its
+    actions.
 
     :param scene_id:
     :param obj_id:
     :return:
     """
 
-    async for project in projects(scene_id):
-        if _project_using_object_as_parent(project, obj_id) or _project_referencing_object(project, obj_id):
-            yield project
+    async for project in _projects(scene_id, lambda po: obj_id in po.parents or obj_id in po.actions):
+        yield project
 
 
-async def projects_using_object_as_parent(scene_id: str, obj_id: str) -> AsyncIterator[UpdateableCachedProject]:
-    async for project in projects(scene_id):
-        if _project_using_object_as_parent(project, obj_id):
-            yield project
+async def invalidate_joints_using_objects_as_parent(obj_ids: set[str]) -> None:
+    """Invalidates robot joints if action point's parent has changed its pose.
 
+    Each affected project is updated just once, regardless of how many of its
+    parents have changed.
+    """
 
-async def invalidate_joints_using_object_as_parent(obj: common.SceneObject) -> None:
     assert glob.LOCK.scene
 
-    # Invalidates robot joints if action point's parent has changed its pose.
-    async for project in projects_using_object_as_parent(glob.LOCK.scene.id, obj.id):
+    async for project in _projects(glob.LOCK.scene.id, lambda po: not po.parents.isdisjoint(obj_ids)):
         for ap in project.action_points:
-            if ap.parent != obj.id:
+            if ap.parent not in obj_ids:
                 continue
 
             logger.debug(f"Invalidating joints for {project.name}/{ap.name}.")
@@ -118,7 +179,6 @@ async def invalidate_joints_using_object_as_parent(obj: common.SceneObject) -> N
         await storage.update_project(project)
 
 
-async def projects_referencing_object(scene_id: str, obj_id: str) -> AsyncIterator[CachedProject]:
-    async for project in projects(scene_id):
-        if _project_referencing_object(project, obj_id):
-            yield project
+async def projects_referencing_object(scene_id: str, obj_id: str) -> AsyncIterator[UpdateableCachedProject]:
+    async for project in _projects(scene_id, lambda po: obj_id in po.actions):
+        yield project
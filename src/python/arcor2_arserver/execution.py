@@ -15,24 +15,21 @@ from arcor2.data.rpc import get_id
 from arcor2.exceptions import Arcor2Exception
 from arcor2_arserver import events as server_events
 from arcor2_arserver import globals as glob
-from arcor2_arserver import logger
-from arcor2_arserver import notifications as notif
-from arcor2_arserver import project
-from arcor2_arserver.scene import scene_started, start_scene, stop_scene
-from arcor2_arserver_data import events as sevts
+from arcor2_arserver import logger, project
+from arcor2_arserver.scene import open_event_json, scene_started, start_scene, stop_scene
 from arcor2_build_data import URL as BUILD_URL
 from arcor2_execution_data import URL as EXE_URL
 from arcor2_execution_data import rpc as erpc
 
 if TYPE_CHECKING:
     ReqQueue = asyncio.Queue[rpc.common.RPC.Request]
-    RespQueue = asyncio.Queue[rpc.common.RPC.Response]
+    RespFuture = asyncio.Future[rpc.common.RPC.Response]
 else:
     ReqQueue = asyncio.Queue
-    RespQueue = asyncio.Queue
+    RespFuture = asyncio.Future
 
 MANAGER_RPC_REQUEST_QUEUE: ReqQueue = ReqQueue()
-MANAGER_RPC_RESPONSES: dict[int, RespQueue] = {}
+MANAGER_RPC_RESPONSES: dict[int, RespFuture] = {}
 
 
 async def run_temp_package(package_id: str, start_paused: bool = False, breakpoints: None | set[str] = None) -> None:
@@ -69,9 +66,7 @@ async def run_temp_package(package_id: str, start_paused: bool = False, breakpoi
     assert glob.LOCK.scene
     assert glob.LOCK.project
 
-    await notif.broadcast_event(
-        sevts.p.OpenProject(sevts.p.OpenProject.Data(glob.LOCK.scene.scene, glob.LOCK.project.project))
-    )
+    glob.USERS.broadcast(open_event_json())
 
     if scene_online:
         await start_scene(glob.LOCK.scene)
@@ -121,11 +116,13 @@ async def build_and_upload_package(project_id: str, package_name: str) -> str:
 async def manager_request(req: rpc.common.RPC.Request, ui: None | WsClient = None) -> rpc.common.RPC.Response:
     assert req.id not in MANAGER_RPC_RESPONSES
 
-    MANAGER_RPC_RESPONSES[req.id] = RespQueue(maxsize=1)
-    await MANAGER_RPC_REQUEST_QUEUE.put(req)
-    resp = await MANAGER_RPC_RESPONSES[req.id].get()
-    del MANAGER_RPC_RESPONSES[req.id]
-    return resp
+    MANAGER_RPC_RESPONSES[req.id] = resp = asyncio.get_running_loop().create_future()
+
+    try:
+        await MANAGER_RPC_REQUEST_QUEUE.put(req)
+        return await resp
+    finally:
+        del MANAGER_RPC_RESPONSES[req.id]
 
 
 async def project_manager_client(handle_manager_incoming_messages) -> None:
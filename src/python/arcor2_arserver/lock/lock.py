@@ -31,6 +31,8 @@ class Lock:
         RUNNING_ACTION: str = "ACTION"
         ADDING_OBJECT: str = "ADDING_OBJECT"
 
+    _SPECIAL_VALUES = frozenset(SpecialValues.set())
+
     class ErrMessages(cmn.StrEnum):
         """Lock general error messages."""
 
@@ -381,16 +383,15 @@ class Lock:
         :param obj_id: object to search root for
         """
 
-        if obj_id in self.SpecialValues.set() | self._object_types.keys():
+        if obj_id in self._SPECIAL_VALUES or obj_id in self._object_types:
             return obj_id
         elif self.project and self.scene:
             if (
-                obj_id
-                in {self.scene.id, self.project.id, cmn.LogicItem.START, cmn.LogicItem.END}
-                | self.project.parameters_ids
+                obj_id in (self.scene.id, self.project.id, cmn.LogicItem.START, cmn.LogicItem.END)
+                or obj_id in self.project.parameters_ids
             ):
                 return obj_id
-            elif obj_id in self.scene.object_ids:
+            elif self.scene.has_object(obj_id):
                 # TODO implement with scene object hierarchy
                 return obj_id
             else:
@@ -405,7 +406,7 @@ class Lock:
                     ...
                 return ret
 
-        elif self.scene and obj_id in self.scene.object_ids | {self.scene.id}:
+        elif self.scene and (obj_id == self.scene.id or self.scene.has_object(obj_id)):
             # TODO implement with scene object hierarchy
             return obj_id
 
@@ -623,7 +624,7 @@ class Lock:
                 ...
 
         if self.scene:  # TODO update with scene object hierarchy
-            if obj_id in self.scene.object_ids:
+            if self.scene.has_object(obj_id):
                 return self.scene.object(obj_id)
 
         raise Arcor2Exception(f"Object ID {obj_id} not found.")
@@ -2,19 +2,31 @@ import asyncio
 
 from websockets.server import WebSocketServerProtocol
 
-from arcor2 import ws_server
 from arcor2.data import events
 from arcor2_arserver import globals as glob
 from arcor2_arserver import logger
 
 
-async def broadcast_event(event: events.Event) -> None:
+def _broadcast_event(event: events.Event) -> None:
     logger.debug(event)
 
     if glob.USERS.interfaces:
-        message = event.to_json()
-        await asyncio.gather(*[ws_server.send_json_to_client(intf, message) for intf in glob.USERS.interfaces])
+        glob.USERS.broadcast(event.to_json())
+
+
+async def broadcast_event(event: events.Event) -> None:
+    _broadcast_event(event)
+
+
+def broadcast_event_soon(event: events.Event) -> None:
+    """Broadcasts the event in the next iteration of the event loop (e.g. after
+    response to the current RPC is sent).
+
+    This is cheaper than ensure_future(broadcast_event(...)) as no task has to be created.
+    """
+
+    asyncio.get_running_loop().call_soon(_broadcast_event, event)
 
 
 async def event(interface: WebSocketServerProtocol, event: events.Event) -> None:
-    await ws_server.send_json_to_client(interface, event.to_json())
+    glob.USERS.send_event(interface, event)
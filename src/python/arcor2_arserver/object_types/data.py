@@ -7,7 +7,7 @@ from arcor2_arserver_data.objects import ObjectAction, ObjectTypeMeta
 from arcor2_arserver_data.robot import RobotMeta
 
 
-@dataclass
+@dataclass(slots=True)
 class ObjectTypeData:
     meta: ObjectTypeMeta
     type_def: None | type[Generic] = None
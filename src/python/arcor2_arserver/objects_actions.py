@@ -1,11 +1,12 @@
 import asyncio
-from typing import NamedTuple
+from datetime import datetime
+from typing import Iterable, NamedTuple
 
 from arcor2 import helpers as hlp
 from arcor2.cached import CachedScene
 from arcor2.clients import aio_asset as asset
 from arcor2.data.events import Event
-from arcor2.data.object_type import Mesh, ObjectModel
+from arcor2.data.object_type import Mesh, ObjectModel, ObjectType
 from arcor2.exceptions import Arcor2Exception
 from arcor2.object_types import utils as otu
 from arcor2.object_types.abstract import Generic, Robot
@@ -31,9 +32,15 @@ from arcor2_arserver.robot import get_robot_meta
 from arcor2_arserver_data.events.objects import ChangedObjectTypes
 from arcor2_arserver_data.objects import ObjectTypeMeta
 
+# mixins (and their modification time) already imported - there is no need to download and import them for each type
+_imported_mixins: dict[str, None | datetime] = {}
 
-def get_types_dict() -> TypesDict:
-    return {k: v.type_def for k, v in glob.OBJECT_TYPES.items() if v.type_def is not None}
+
+def get_types_dict(obj_types: None | ObjectTypeDict = None) -> TypesDict:
+    if obj_types is None:
+        obj_types = glob.OBJECT_TYPES
+
+    return {k: v.type_def for k, v in obj_types.items() if v.type_def is not None}
 
 
 def get_obj_type_data(scene: CachedScene, object_id: str) -> ObjectTypeData:
@@ -49,9 +56,26 @@ def valid_object_types() -> ObjectTypeDict:
     return {obj_type: obj for obj_type, obj in glob.OBJECT_TYPES.items() if not obj.meta.disabled}
 
 
-async def get_object_data(object_types: ObjectTypeDict, obj_id: str) -> None:
+async def download_object_types(obj_ids: Iterable[str]) -> dict[str, ObjectType]:
+    """Downloads ObjectTypes in parallel."""
+
+    semaphore = asyncio.Semaphore(settings.MAX_PARALLEL_DOWNLOADS)
+
+    async def _download(obj_id: str) -> ObjectType:
+        async with semaphore:
+            return await storage.get_object_type(obj_id)
+
+    return {ot.id: ot for ot in await asyncio.gather(*[_download(obj_id) for obj_id in obj_ids])}
+
+
+async def get_object_data(
+    object_types: ObjectTypeDict, obj_id: str, downloaded: None | dict[str, ObjectType] = None
+) -> None:
     logger.debug(f"Processing {obj_id}.")
 
+    if downloaded is None:
+        downloaded = {}
+
     if obj_id in object_types:
         logger.debug(f"{obj_id} already processed, skipping...")
         return
@@ -66,21 +90,29 @@ async def get_object_data(object_types: ObjectTypeDict, obj_id: str) -> None:
             logger.debug(f"No need to update {obj_id}.")
             return
 
-    obj = await storage.get_object_type(obj_id)
+    obj = downloaded.get(obj_id) or await storage.get_object_type(obj_id)
 
     try:
-        bases = otu.base_from_source(obj.source, obj_id)
+        # the tree is needed to get bases and then actions, so the source is parsed just once
+        ast = await hlp.run_in_executor(parse, obj.source)
+        bases = otu.base_from_source(ast, obj_id)
 
         if not bases:
             logger.debug(f"{obj_id} is definitely not an ObjectType (subclass of {object.__name__}), maybe mixin?")
             return
 
-        if bases[0] not in object_types.keys() | built_in_types_names():
+        if bases[0] not in object_types and bases[0] not in built_in_types_names():
             logger.debug(f"Getting base class {bases[0]} for {obj_id}.")
-            await get_object_data(object_types, bases[0])
+            await get_object_data(object_types, bases[0], downloaded)
 
         for mixin in bases[1:]:
-            mixin_obj = await storage.get_object_type(mixin)
+            mixin_modified = (await storage.get_object_type_iddesc(mixin)).modified
+
+            if mixin in _imported_mixins and _imported_mixins[mixin] == mixin_modified:
+                logger.debug(f"Mixin {mixin} already imported.")
+                continue
+
+            mixin_obj = downloaded.get(mixin) or await storage.get_object_type(mixin)
 
             await hlp.run_in_executor(
                 hlp.save_and_import_type_def,
@@ -91,6 +123,8 @@ async def get_object_data(object_types: ObjectTypeDict, obj_id: str) -> None:
                 settings.OBJECT_TYPE_MODULE,
             )
 
+            _imported_mixins[mixin] = mixin_obj.modified
+
     except Arcor2Exception as e:
         logger.error(f"Disabling ObjectType {obj.id}: can't get a base. {str(e)}")
         object_types[obj_id] = ObjectTypeData(
@@ -149,7 +183,6 @@ async def get_object_data(object_types: ObjectTypeDict, obj_id: str) -> None:
         kwargs = {model.type().value.lower(): model}
         meta.object_model = ObjectModel(model.type(), **kwargs)  # type: ignore
 
-    ast = parse(obj.source)
     otd = ObjectTypeData(meta, type_def, object_actions(type_def, ast), ast)
 
     object_types[obj_id] = otd
@@ -190,8 +223,18 @@ async def get_object_types() -> UpdatedObjectTypes:
         object_type_ids = list(object_type_ids)
         random.shuffle(object_type_ids)
 
+    # ObjectTypes have to be processed one by one (bases first), but new/updated ones can be downloaded in advance
+    downloaded = await download_object_types(
+        [
+            obj_id
+            for obj_id in object_type_ids
+            if obj_id not in glob.OBJECT_TYPES
+            or glob.OBJECT_TYPES[obj_id].meta.modified != (await storage.get_object_type_iddesc(obj_id)).modified
+        ]
+    )
+
     for obj_id in object_type_ids:
-        await get_object_data(updated_object_types, obj_id)
+        await get_object_data(updated_object_types, obj_id, downloaded)
 
     removed_object_ids = {
         obj for obj in glob.OBJECT_TYPES.keys() if obj not in object_type_ids
@@ -208,7 +251,7 @@ async def get_object_types() -> UpdatedObjectTypes:
 
         remove_evt = ChangedObjectTypes([v.meta for k, v in glob.OBJECT_TYPES.items() if k in removed_object_ids])
         remove_evt.change_type = Event.Type.REMOVE
-        asyncio.ensure_future(notif.broadcast_event(remove_evt))
+        notif.broadcast_event_soon(remove_evt)
 
         for removed in removed_object_ids:
             assert removed not in built_in_types_names(), "Attempt to remove built-in type."
@@ -234,12 +277,12 @@ async def get_object_types() -> UpdatedObjectTypes:
         if updated_object_ids:
             update_evt = ChangedObjectTypes([v.meta for k, v in glob.OBJECT_TYPES.items() if k in updated_object_ids])
             update_evt.change_type = Event.Type.UPDATE
-            asyncio.ensure_future(notif.broadcast_event(update_evt))
+            notif.broadcast_event_soon(update_evt)
 
         if new_object_ids:
             add_evt = ChangedObjectTypes([v.meta for k, v in glob.OBJECT_TYPES.items() if k in new_object_ids])
             add_evt.change_type = Event.Type.ADD
-            asyncio.ensure_future(notif.broadcast_event(add_evt))
+            notif.broadcast_event_soon(add_evt)
 
     for obj_type in updated_object_types.values():
         if obj_type.type_def and issubclass(obj_type.type_def, Robot) and not obj_type.type_def.abstract():
@@ -1,4 +1,5 @@
 import asyncio
+import copy
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Callable
@@ -12,10 +13,10 @@ from arcor2_arserver import notifications as notif
 from arcor2_arserver.checks import project_problems
 from arcor2_arserver.clients import project_service as storage
 from arcor2_arserver.objects_actions import get_object_types
-from arcor2_arserver.scene import SceneProblems, get_ot_modified, get_scene_state, open_scene
+from arcor2_arserver.scene import SceneProblems, get_ot_modified, get_scene_state, open_event_json, open_scene
 from arcor2_arserver_data.events.actions import ActionExecution, ActionResult
 from arcor2_arserver_data.events.common import ShowMainScreen
-from arcor2_arserver_data.events.project import OpenProject, ProjectClosed
+from arcor2_arserver_data.events.project import ProjectClosed
 from arcor2_runtime.action import results_to_json
 
 
@@ -45,13 +46,14 @@ async def get_project_problems(scene: CachedScene, project: CachedProject) -> No
     ):
         logger.debug(f"Updating project_problems for {project.name}.")
 
-        _project_problems[project.id] = ProjectProblems(
-            scene.modified,
-            project_problems(glob.OBJECT_TYPES, scene, project),
-            ot_modified,
-            project.modified,
+        # checking a bigger project takes a while, so it is done off the event loop
+        # ...glob.OBJECT_TYPES, scene and project might be modified in the meantime, therefore copies are passed
+        problems = await hlp.run_in_executor(
+            project_problems, dict(glob.OBJECT_TYPES), copy.deepcopy(scene), copy.deepcopy(project)
         )
 
+        _project_problems[project.id] = ProjectProblems(scene.modified, problems, ot_modified, project.modified)
+
     # prune removed projects
     for csi in set(_project_problems.keys()) - await storage.get_project_ids():
         logger.debug(f"Pruning cached problems for removed project {csi}.")
@@ -62,8 +64,8 @@ async def get_project_problems(scene: CachedScene, project: CachedProject) -> No
     return sp if sp else None
 
 
-async def notify_project_opened(evt: OpenProject) -> None:
-    await notif.broadcast_event(evt)
+async def notify_project_opened() -> None:
+    glob.USERS.broadcast(open_event_json())
     await notif.broadcast_event(get_scene_state())
 
 
@@ -318,7 +318,7 @@ async def new_object_type_cb(req: srpc.o.NewObjectType.Request, ui: WsClient) ->
 
         evt = sevts.o.ChangedObjectTypes([meta])
         evt.change_type = events.Event.Type.ADD
-        asyncio.ensure_future(notif.broadcast_event(evt))
+        notif.broadcast_event_soon(evt)
         return None
 
 
@@ -355,7 +355,7 @@ async def update_object_model_cb(req: srpc.o.UpdateObjectModel.Request, ui: WsCl
 
     evt = sevts.o.ChangedObjectTypes([obj_data.meta])
     evt.change_type = events.Event.Type.UPDATE
-    asyncio.ensure_future(notif.broadcast_event(evt))
+    notif.broadcast_event_soon(evt)
 
 
 async def get_object_actions_cb(req: srpc.o.GetActions.Request, ui: WsClient) -> srpc.o.GetActions.Response:
@@ -410,7 +410,7 @@ async def delete_object_type_cb(
 
         evt = sevts.o.ChangedObjectTypes([obj_type.meta])
         evt.change_type = events.Event.Type.REMOVE
-        asyncio.create_task(notif.broadcast_event(evt))
+        notif.broadcast_event_soon(evt)
 
     user_name = glob.USERS.user_name(ui)
 
@@ -496,7 +496,7 @@ async def add_override_cb(req: srpc.o.AddOverride.Request, ui: WsClient) -> None
     evt = sevts.o.OverrideUpdated(req.args.override)
     evt.change_type = events.Event.Type.ADD
     evt.parent_id = req.args.id
-    asyncio.ensure_future(notif.broadcast_event(evt))
+    notif.broadcast_event_soon(evt)
 
 
 async def update_override_cb(req: srpc.o.UpdateOverride.Request, ui: WsClient) -> None:
@@ -518,7 +518,7 @@ async def update_override_cb(req: srpc.o.UpdateOverride.Request, ui: WsClient) -
     evt = sevts.o.OverrideUpdated(req.args.override)
     evt.change_type = events.Event.Type.UPDATE
     evt.parent_id = req.args.id
-    asyncio.ensure_future(notif.broadcast_event(evt))
+    notif.broadcast_event_soon(evt)
 
 
 async def delete_override_cb(req: srpc.o.DeleteOverride.Request, ui: WsClient) -> None:
@@ -542,7 +542,7 @@ async def delete_override_cb(req: srpc.o.DeleteOverride.Request, ui: WsClient) -
     evt = sevts.o.OverrideUpdated(req.args.override)
     evt.change_type = events.Event.Type.REMOVE
     evt.parent_id = req.args.id
-    asyncio.ensure_future(notif.broadcast_event(evt))
+    notif.broadcast_event_soon(evt)
 
 
 async def object_type_usage_cb(req: srpc.o.ObjectTypeUsage.Request, ui: WsClient) -> srpc.o.ObjectTypeUsage.Response:
@@ -13,13 +13,13 @@ from arcor2.data.events import Event, PackageState
 from arcor2.exceptions import Arcor2Exception
 from arcor2.logic import check_for_loops
 from arcor2.object_types.abstract import Generic, Robot
-from arcor2.parameter_plugins.base import ParameterPluginException
+from arcor2.parameter_plugins.base import ParameterPluginException, TypesDict
 from arcor2.parameter_plugins.pose import PosePlugin
 from arcor2.parameter_plugins.utils import plugin_from_type_name
 from arcor2_arserver import globals as glob
 from arcor2_arserver import logger
 from arcor2_arserver import notifications as notif
-from arcor2_arserver import project
+from arcor2_arserver import project, settings
 from arcor2_arserver.checks import (
     check_action_params,
     check_ap_parent,
@@ -114,7 +114,7 @@ async def cancel_action_cb(req: srpc.p.CancelAction.Request, ui: WsClient) -> No
 
     await hlp.run_in_executor(cancel_method, *cancel_params.values())
 
-    asyncio.ensure_future(notif.broadcast_event(sevts.a.ActionCancelled()))
+    notif.broadcast_event_soon(sevts.a.ActionCancelled())
     glob.RUNNING_ACTION = None
     glob.RUNNING_ACTION_PARAMS = None
 
@@ -138,6 +138,8 @@ async def execute_action_cb(req: srpc.p.ExecuteAction.Request, ui: WsClient) ->
 
         params: list[Any] = []
 
+        types_dict: None | TypesDict = None  # created on demand, just once
+
         for param in action.parameters:
             if param.type == common.ActionParameter.TypeEnum.LINK:
                 parsed_link = param.parse_link()
@@ -161,10 +163,13 @@ async def execute_action_cb(req: srpc.p.ExecuteAction.Request, ui: WsClient) ->
 
                 params.append(json.loads(pparam.value))
             else:
+                if types_dict is None:
+                    types_dict = get_types_dict()
+
                 try:
                     params.append(
                         plugin_from_type_name(param.type).parameter_execution_value(
-                            get_types_dict(), scene, proj, action.id, param.name
+                            types_dict, scene, proj, action.id, param.name
                         )
                     )
                 except ParameterPluginException as e:
@@ -194,30 +199,33 @@ async def execute_action_cb(req: srpc.p.ExecuteAction.Request, ui: WsClient) ->
 
 
 async def list_projects_cb(req: srpc.p.ListProjects.Request, ui: WsClient) -> srpc.p.ListProjects.Response:
+    semaphore = asyncio.Semaphore(settings.MAX_PARALLEL_DOWNLOADS)
+
     async def project_info(project_id: str) -> srpc.p.ListProjects.Response.Data:
-        project = await storage.get_project(project_id)
-
-        assert project.created
-        assert project.modified
-
-        pd = srpc.p.ListProjects.Response.Data(
-            project.name,
-            project.scene_id,
-            project.description,
-            project.has_logic,
-            project.created,
-            project.modified,
-            id=project.id,
-        )
+        async with semaphore:
+            project = await storage.get_project(project_id)
+
+            assert project.created
+            assert project.modified
+
+            pd = srpc.p.ListProjects.Response.Data(
+                project.name,
+                project.scene_id,
+                project.description,
+                project.has_logic,
+                project.created,
+                project.modified,
+                id=project.id,
+            )
 
-        try:
-            scene = await storage.get_scene(project.scene_id)
-        except storage.ProjectServiceException:
-            pd.problems = ["Scene does not exist."]
-            return pd
+            try:
+                scene = await storage.get_scene(project.scene_id)
+            except storage.ProjectServiceException:
+                pd.problems = ["Scene does not exist."]
+                return pd
 
-        pd.problems = await get_project_problems(scene, project)
-        return pd
+            pd.problems = await get_project_problems(scene, project)
+            return pd
 
     resp = srpc.p.ListProjects.Response()
 
@@ -314,7 +322,7 @@ async def add_action_point_joints_using_robot_cb(
         evt = sevts.p.JointsChanged(prj)
         evt.change_type = Event.Type.ADD
         evt.parent_id = ap.id
-        asyncio.ensure_future(notif.broadcast_event(evt))
+        notif.broadcast_event_soon(evt)
         return None
 
 
@@ -339,7 +347,7 @@ async def update_action_point_joints_using_robot_cb(
 
         evt = sevts.p.JointsChanged(robot_joints)
         evt.change_type = Event.Type.UPDATE
-        asyncio.ensure_future(notif.broadcast_event(evt))
+        notif.broadcast_event_soon(evt)
         return None
 
 
@@ -360,7 +368,7 @@ async def update_action_point_joints_cb(req: srpc.p.UpdateActionPointJoints.Requ
 
     evt = sevts.p.JointsChanged(robot_joints)
     evt.change_type = Event.Type.UPDATE
-    asyncio.ensure_future(notif.broadcast_event(evt))
+    notif.broadcast_event_soon(evt)
     return None
 
 
@@ -387,7 +395,7 @@ async def remove_action_point_joints_cb(req: srpc.p.RemoveActionPointJoints.Requ
 
     evt = sevts.p.JointsChanged(joints_to_be_removed)
     evt.change_type = Event.Type.REMOVE
-    asyncio.ensure_future(notif.broadcast_event(evt))
+    notif.broadcast_event_soon(evt)
     return None
 
 
@@ -416,7 +424,7 @@ async def rename_action_point_cb(req: srpc.p.RenameActionPoint.Request, ui: WsCl
 
     evt = sevts.p.ActionPointChanged(ap)
     evt.change_type = Event.Type.UPDATE_BASE
-    asyncio.ensure_future(notif.broadcast_event(evt))
+    notif.broadcast_event_soon(evt)
 
     return None
 
@@ -500,12 +508,12 @@ async def update_action_point_parent_cb(req: srpc.p.UpdateActionPointParent.Requ
         # 'ap' is BareActionPoint, that does not contain orientations
         evt = sevts.p.ActionPointChanged(proj.action_point(req.args.action_point_id))
         evt.change_type = Event.Type.UPDATE
-        asyncio.ensure_future(notif.broadcast_event(evt))
+        notif.broadcast_event_soon(evt)
 
         for cap in updated_aps:
             evt = sevts.p.ActionPointChanged(proj.action_point(cap))
             evt.change_type = Event.Type.UPDATE
-            asyncio.ensure_future(notif.broadcast_event(evt))
+            notif.broadcast_event_soon(evt)
 
     await glob.LOCK.write_unlock(ap.id, user_name, True)
 
@@ -532,11 +540,11 @@ async def update_ap_position(
         evt = sevts.p.JointsChanged(joints)
         evt.change_type = Event.Type.UPDATE
         evt.parent_id = ap.id
-        asyncio.ensure_future(notif.broadcast_event(evt))
+        notif.broadcast_event_soon(evt)
 
     ap_evt = sevts.p.ActionPointChanged(ap)
     ap_evt.change_type = Event.Type.UPDATE_BASE
-    asyncio.ensure_future(notif.broadcast_event(ap_evt))
+    notif.broadcast_event_soon(ap_evt)
 
 
 async def update_action_point_position_cb(req: srpc.p.UpdateActionPointPosition.Request, ui: WsClient) -> None:
@@ -600,7 +608,7 @@ async def add_action_point_orientation_cb(req: srpc.p.AddActionPointOrientation.
     evt = sevts.p.OrientationChanged(orientation)
     evt.change_type = Event.Type.ADD
     evt.parent_id = ap.id
-    asyncio.ensure_future(notif.broadcast_event(evt))
+    notif.broadcast_event_soon(evt)
     return None
 
 
@@ -621,7 +629,7 @@ async def update_action_point_orientation_cb(req: srpc.p.UpdateActionPointOrient
 
     evt = sevts.p.OrientationChanged(orientation)
     evt.change_type = Event.Type.UPDATE
-    asyncio.ensure_future(notif.broadcast_event(evt))
+    notif.broadcast_event_soon(evt)
     return None
 
 
@@ -663,7 +671,7 @@ async def add_action_point_orientation_using_robot_cb(
         evt = sevts.p.OrientationChanged(orientation)
         evt.change_type = Event.Type.ADD
         evt.parent_id = ap.id
-        asyncio.ensure_future(notif.broadcast_event(evt))
+        notif.broadcast_event_soon(evt)
         return None
 
 
@@ -700,7 +708,7 @@ async def update_action_point_orientation_using_robot_cb(
 
         evt = sevts.p.OrientationChanged(ori)
         evt.change_type = Event.Type.UPDATE
-        asyncio.ensure_future(notif.broadcast_event(evt))
+        notif.broadcast_event_soon(evt)
         return None
 
 
@@ -733,7 +741,7 @@ async def remove_action_point_orientation_cb(req: srpc.p.RemoveActionPointOrient
 
         evt = sevts.p.OrientationChanged(orientation)
         evt.change_type = Event.Type.REMOVE
-        asyncio.ensure_future(notif.broadcast_event(evt))
+        notif.broadcast_event_soon(evt)
         return None
 
 
@@ -755,11 +763,7 @@ async def open_project_cb(req: srpc.p.OpenProject.Request, ui: WsClient) -> None
         assert glob.LOCK.scene
         assert glob.LOCK.project
 
-        asyncio.ensure_future(
-            notify_project_opened(
-                sevts.p.OpenProject(sevts.p.OpenProject.Data(glob.LOCK.scene.scene, glob.LOCK.project.project))
-            )
-        )
+        asyncio.ensure_future(notify_project_opened())
 
         return None
 
@@ -781,7 +785,7 @@ async def save_project_cb(req: srpc.p.SaveProject.Request, ui: WsClient) -> None
         proj.modified = await storage.update_project(proj)
         logger.info(f"Updating the project took {time.monotonic()-start:.3f}s.")
 
-    asyncio.ensure_future(notif.broadcast_event(sevts.p.ProjectSaved()))
+    notif.broadcast_event_soon(sevts.p.ProjectSaved())
     return None
 
 
@@ -840,11 +844,7 @@ async def new_project_cb(req: srpc.p.NewProject.Request, ui: WsClient) -> None:
             common.ProjectParameter("project_id", "string", json.dumps(glob.LOCK.project.id))
         )
 
-        asyncio.ensure_future(
-            notify_project_opened(
-                sevts.p.OpenProject(sevts.p.OpenProject.Data(glob.LOCK.scene.scene, glob.LOCK.project.project))
-            )
-        )
+        asyncio.ensure_future(notify_project_opened())
         return None
 
 
@@ -879,7 +879,7 @@ async def add_action_point_cb(req: srpc.p.AddActionPoint.Request, ui: WsClient)
 
         evt = sevts.p.ActionPointChanged(ap)
         evt.change_type = Event.Type.ADD
-        asyncio.ensure_future(notif.broadcast_event(evt))
+        notif.broadcast_event_soon(evt)
         return None
 
 
@@ -947,7 +947,7 @@ async def remove_action_point_cb(req: srpc.p.RemoveActionPoint.Request, ui: WsCl
 
         evt = sevts.p.ActionPointChanged(ap)
         evt.change_type = Event.Type.REMOVE
-        asyncio.ensure_future(notif.broadcast_event(evt))
+        notif.broadcast_event_soon(evt)
         return None
 
 
@@ -1008,8 +1008,7 @@ async def copy_action_point_cb(req: srpc.p.CopyActionPoint.Request, ui: WsClient
         await asyncio.gather(
             *[
                 copy_action_point(proj.action_point(child_id), ap.id)
-                for child_id in proj.childs(orig_ap.id)
-                if child_id in proj.action_points_ids
+                for child_id in proj.childs(orig_ap.id) & proj.action_points_ids
             ]
         )
 
@@ -1018,7 +1017,7 @@ async def copy_action_point_cb(req: srpc.p.CopyActionPoint.Request, ui: WsClient
 
     async with ctx_read_lock(childs_of_original_ap | {req.args.id}, user_name):
         # filter out only APs
-        child_aps = {ch for ch in childs_of_original_ap if ch in proj.action_points_ids} | {req.args.id}
+        child_aps = (childs_of_original_ap & proj.action_points_ids) | {req.args.id}
         logger.debug(f"Child action points of the original AP: {child_aps}")
 
         original_ap = proj.bare_action_point(req.args.id)
@@ -1061,6 +1060,7 @@ async def copy_action_point_cb(req: srpc.p.CopyActionPoint.Request, ui: WsClient
                 else:
                     logger.debug(f"Updating orientation from {old_ori.id} to {new_ori_id}.")
                     param.value = json.dumps(new_ori_id)
+                    proj.update_modified()
 
             action_added_evt = sevts.p.ActionChanged(new_act)
             action_added_evt.change_type = Event.Type.ADD
@@ -1103,7 +1103,7 @@ async def add_action_cb(req: srpc.p.AddAction.Request, ui: WsClient) -> None:
         evt = sevts.p.ActionChanged(new_action)
         evt.change_type = Event.Type.ADD
         evt.parent_id = ap.id
-        asyncio.ensure_future(notif.broadcast_event(evt))
+        notif.broadcast_event_soon(evt)
         return None
 
 
@@ -1136,7 +1136,7 @@ async def update_action_cb(req: srpc.p.UpdateAction.Request, ui: WsClient) -> No
 
     evt = sevts.p.ActionChanged(updated_action)
     evt.change_type = Event.Type.UPDATE
-    asyncio.ensure_future(notif.broadcast_event(evt))
+    notif.broadcast_event_soon(evt)
     return None
 
 
@@ -1178,7 +1178,7 @@ async def remove_action_cb(req: srpc.p.RemoveAction.Request, ui: WsClient) -> No
 
         evt = sevts.p.ActionChanged(action.bare)
         evt.change_type = Event.Type.REMOVE
-        asyncio.ensure_future(notif.broadcast_event(evt))
+        notif.broadcast_event_soon(evt)
         return None
 
 
@@ -1204,7 +1204,7 @@ async def add_logic_item_cb(req: srpc.p.AddLogicItem.Request, ui: WsClient) -> N
 
         evt = sevts.p.LogicItemChanged(logic_item)
         evt.change_type = Event.Type.ADD
-        asyncio.ensure_future(notif.broadcast_event(evt))
+        notif.broadcast_event_soon(evt)
 
     await glob.LOCK.write_unlock(
         [item for item in (req.args.start, req.args.end) if item not in to_lock], user_name, True
@@ -1237,7 +1237,7 @@ async def update_logic_item_cb(req: srpc.p.UpdateLogicItem.Request, ui: WsClient
 
     evt = sevts.p.LogicItemChanged(updated_logic_item)
     evt.change_type = Event.Type.UPDATE
-    asyncio.ensure_future(notif.broadcast_event(evt))
+    notif.broadcast_event_soon(evt)
     return None
 
 
@@ -1253,7 +1253,7 @@ async def remove_logic_item_cb(req: srpc.p.RemoveLogicItem.Request, ui: WsClient
 
         evt = sevts.p.LogicItemChanged(logic_item)
         evt.change_type = Event.Type.REMOVE
-        asyncio.ensure_future(notif.broadcast_event(evt))
+        notif.broadcast_event_soon(evt)
 
     await glob.LOCK.write_unlock(
         [item for item in (logic_item.start, logic_item.end) if item not in to_lock], user_name, True
@@ -1275,7 +1275,7 @@ async def add_project_parameter_cb(req: srpc.p.AddProjectParameter.Request, ui:
 
         evt = sevts.p.ProjectParameterChanged(pparam)
         evt.change_type = Event.Type.ADD
-        asyncio.ensure_future(notif.broadcast_event(evt))
+        notif.broadcast_event_soon(evt)
         return None
 
 
@@ -1302,7 +1302,7 @@ async def update_project_parameter_cb(req: srpc.p.UpdateProjectParameter.Request
 
     evt = sevts.p.ProjectParameterChanged(updated_param)
     evt.change_type = Event.Type.UPDATE
-    asyncio.create_task(notif.broadcast_event(evt))
+    notif.broadcast_event_soon(evt)
 
     await glob.LOCK.write_unlock(param.id, user_name, True)
 
@@ -1332,7 +1332,7 @@ async def remove_project_parameter_cb(req: srpc.p.RemoveProjectParameter.Request
 
         evt = sevts.p.ProjectParameterChanged(pparam)
         evt.change_type = Event.Type.REMOVE
-        asyncio.ensure_future(notif.broadcast_event(evt))
+        notif.broadcast_event_soon(evt)
 
 
 async def delete_project_cb(req: srpc.p.DeleteProject.Request, ui: WsClient) -> None:
@@ -1348,7 +1348,7 @@ async def delete_project_cb(req: srpc.p.DeleteProject.Request, ui: WsClient) ->
 
         evt = sevts.p.ProjectChanged(project.bare)
         evt.change_type = Event.Type.REMOVE
-        asyncio.ensure_future(notif.broadcast_event(evt))
+        notif.broadcast_event_soon(evt)
         return None
 
 
@@ -1371,7 +1371,7 @@ async def rename_project_cb(req: srpc.p.RenameProject.Request, ui: WsClient) ->
 
         evt = sevts.p.ProjectChanged(project.bare)
         evt.change_type = Event.Type.UPDATE_BASE
-        asyncio.ensure_future(notif.broadcast_event(evt))
+        notif.broadcast_event_soon(evt)
 
     await glob.LOCK.write_unlock(req.args.project_id, user_name)
     return None
@@ -1389,7 +1389,7 @@ async def copy_project_cb(req: srpc.p.CopyProject.Request, ui: WsClient) -> None
 
             evt = sevts.p.ProjectChanged(project.bare)
             evt.change_type = Event.Type.UPDATE_BASE
-            asyncio.ensure_future(notif.broadcast_event(evt))
+            notif.broadcast_event_soon(evt)
 
         return None
 
@@ -1402,7 +1402,7 @@ async def update_project_description_cb(req: srpc.p.UpdateProjectDescription.Req
 
             evt = sevts.p.ProjectChanged(project.bare)
             evt.change_type = Event.Type.UPDATE_BASE
-            asyncio.ensure_future(notif.broadcast_event(evt))
+            notif.broadcast_event_soon(evt)
         return None
 
 
@@ -1424,7 +1424,7 @@ async def update_project_has_logic_cb(req: srpc.p.UpdateProjectHasLogic.Request,
 
             evt = sevts.p.ProjectChanged(project.bare)
             evt.change_type = Event.Type.UPDATE_BASE
-            asyncio.ensure_future(notif.broadcast_event(evt))
+            notif.broadcast_event_soon(evt)
         return None
 
 
@@ -1445,7 +1445,7 @@ async def rename_action_point_joints_cb(req: srpc.p.RenameActionPointJoints.Requ
 
     evt = sevts.p.JointsChanged(joints)
     evt.change_type = Event.Type.UPDATE_BASE
-    asyncio.ensure_future(notif.broadcast_event(evt))
+    notif.broadcast_event_soon(evt)
 
     return None
 
@@ -1467,7 +1467,7 @@ async def rename_action_point_orientation_cb(req: srpc.p.RenameActionPointOrient
 
     evt = sevts.p.OrientationChanged(ori)
     evt.change_type = Event.Type.UPDATE_BASE
-    asyncio.ensure_future(notif.broadcast_event(evt))
+    notif.broadcast_event_soon(evt)
 
     return None
 
@@ -1491,6 +1491,6 @@ async def rename_action_cb(req: srpc.p.RenameAction.Request, ui: WsClient) -> No
 
     evt = sevts.p.ActionChanged(act)
     evt.change_type = Event.Type.UPDATE_BASE
-    asyncio.ensure_future(notif.broadcast_event(evt))
+    notif.broadcast_event_soon(evt)
 
     return None
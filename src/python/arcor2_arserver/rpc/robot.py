@@ -8,7 +8,6 @@ from websockets.server import WebSocketServerProtocol as WsClient
 
 from arcor2 import env
 from arcor2 import transformations as tr
-from arcor2 import ws_server
 from arcor2.clients.project_service import URL as ps_url
 from arcor2.data import common
 from arcor2.exceptions import Arcor2Exception
@@ -59,9 +58,8 @@ async def robot_joints_event(robot_inst: Robot) -> None:
             continue
 
         evt_json = evt.to_json()
-        await asyncio.gather(
-            *[ws_server.send_json_to_client(ui, evt_json) for ui in glob.ROBOT_JOINTS_REGISTERED_UIS[robot_inst.id]]
-        )
+        for ui in glob.ROBOT_JOINTS_REGISTERED_UIS[robot_inst.id]:
+            glob.USERS.send(ui, evt_json)
 
         end = time.monotonic()
         await asyncio.sleep(EVENT_PERIOD - (end - start))
@@ -107,9 +105,8 @@ async def robot_eef_pose_event(robot_inst: Robot) -> None:
                 continue
 
             evt_json = evt.to_json()
-            await asyncio.gather(
-                *[ws_server.send_json_to_client(ui, evt_json) for ui in glob.ROBOT_EEF_REGISTERED_UIS[robot_inst.id]]
-            )
+            for ui in glob.ROBOT_EEF_REGISTERED_UIS[robot_inst.id]:
+                glob.USERS.send(ui, evt_json)
 
             end = time.monotonic()
             await asyncio.sleep(EVENT_PERIOD - (end - start))
@@ -519,7 +516,7 @@ async def hand_teaching_mode_cb(req: srpc.r.HandTeachingMode.Request, ui: WsClie
 
     await run_in_executor(robot_inst.set_hand_teaching_mode, req.args.enable, *params)
     evt = HandTeachingMode(HandTeachingMode.Data(req.args.robot_id, req.args.enable, req.args.arm_id))
-    asyncio.ensure_future(notif.broadcast_event(evt))
+    notif.broadcast_event_soon(evt)
 
 
 async def step_robot_eef_cb(req: srpc.r.StepRobotEef.Request, ui: WsClient) -> None:
@@ -121,7 +121,7 @@ async def new_scene_cb(req: srpc.s.NewScene.Request, ui: WsClient) -> None:
         await get_object_types()
 
         glob.LOCK.scene = UpdateableCachedScene(common.Scene(req.args.name, description=req.args.description))
-        asyncio.ensure_future(notify_scene_opened(sevts.s.OpenScene(sevts.s.OpenScene.Data(glob.LOCK.scene.scene))))
+        asyncio.ensure_future(notify_scene_opened())
 
         return None
 
@@ -183,9 +183,7 @@ async def open_scene_cb(req: srpc.s.OpenScene.Request, ui: WsClient) -> None:
 
         assert glob.LOCK.scene
         assert not glob.LOCK.scene.has_changes
-        asyncio.ensure_future(
-            notify_scene_opened(sevts.s.OpenScene(data=sevts.s.OpenScene.Data(glob.LOCK.scene.scene)))
-        )
+        asyncio.ensure_future(notify_scene_opened())
         return None
 
 
@@ -231,7 +229,7 @@ async def add_object_to_scene_cb(req: srpc.s.AddObjectToScene.Request, ui: WsCli
 
         evt = sevts.s.SceneObjectChanged(obj)
         evt.change_type = Event.Type.ADD
-        asyncio.ensure_future(notif.broadcast_event(evt))
+        notif.broadcast_event_soon(evt)
         return None
 
 
@@ -259,7 +257,7 @@ async def update_object_parameters_cb(req: srpc.s.UpdateObjectParameters.Request
 
     evt = sevts.s.SceneObjectChanged(obj)
     evt.change_type = Event.Type.UPDATE
-    asyncio.ensure_future(notif.broadcast_event(evt))
+    notif.broadcast_event_soon(evt)
     return None
 
 
@@ -275,7 +273,7 @@ async def scene_object_usage_request_cb(
     scene = glob.LOCK.scene_or_exception()
 
     async with ctx_read_lock(req.args.id, glob.USERS.user_name(ui)):
-        if not (any(obj.id == req.args.id for obj in scene.objects)):
+        if not scene.has_object(req.args.id):
             raise Arcor2Exception("Unknown ID.")
 
         resp = srpc.s.SceneObjectUsage.Response()
@@ -343,7 +341,7 @@ async def remove_from_scene_cb(req: srpc.s.RemoveFromScene.Request, ui: WsClient
         if req.dry_run:
             return None
 
-        if req.args.id not in scene.object_ids:
+        if not scene.has_object(req.args.id):
             raise Arcor2Exception("Unknown id.")
 
         await glob.LOCK.write_unlock(req.args.id, user_name)
@@ -356,7 +354,7 @@ async def remove_from_scene_cb(req: srpc.s.RemoveFromScene.Request, ui: WsClient
 
         evt = sevts.s.SceneObjectChanged(obj)
         evt.change_type = Event.Type.REMOVE
-        asyncio.ensure_future(notif.broadcast_event(evt))
+        notif.broadcast_event_soon(evt)
 
         # TODO this should be done after scene is saved
         asyncio.ensure_future(remove_object_references_from_projects(req.args.id))
@@ -487,7 +485,7 @@ async def rename_object_cb(req: srpc.s.RenameObject.Request, ui: WsClient) -> No
 
     evt = sevts.s.SceneObjectChanged(target_obj)
     evt.change_type = Event.Type.UPDATE
-    asyncio.ensure_future(notif.broadcast_event(evt))
+    notif.broadcast_event_soon(evt)
 
     await glob.LOCK.write_unlock(req.args.id, user_name, True)
     return None
@@ -507,10 +505,11 @@ async def rename_scene_cb(req: srpc.s.RenameScene.Request, ui: WsClient) -> None
 
     async with managed_scene(req.args.id) as scene:
         scene.name = req.args.new_name
+        scene.update_modified()
 
         evt = sevts.s.SceneChanged(scene.bare)
         evt.change_type = Event.Type.UPDATE_BASE
-        asyncio.ensure_future(notif.broadcast_event(evt))
+        notif.broadcast_event_soon(evt)
 
     await glob.LOCK.write_unlock(req.args.id, user_name, True)
     return None
@@ -537,14 +536,19 @@ async def delete_scene_cb(req: srpc.s.DeleteScene.Request, ui: WsClient) -> None
         await glob.LOCK.write_unlock(req.args.id, user_name)
         await storage.delete_scene(req.args.id)
 
-        for obj_type in scene.object_types:
-            if (meta := glob.OBJECT_TYPES[obj_type].meta).base == VirtualCollisionObject.__name__:
-                logger.debug(f"VCO {meta.type} will be (probably) auto-removed.")
-                asyncio.create_task(delete_if_not_used(meta))
+        vcos = [
+            glob.OBJECT_TYPES[obj_type].meta
+            for obj_type in scene.object_types
+            if glob.OBJECT_TYPES[obj_type].meta.base == VirtualCollisionObject.__name__
+        ]
+
+        if vcos:
+            logger.debug(f"VCOs {[meta.type for meta in vcos]} will be (probably) auto-removed.")
+            asyncio.create_task(delete_if_not_used(vcos))
 
         evt = sevts.s.SceneChanged(scene.bare)
         evt.change_type = Event.Type.REMOVE
-        asyncio.ensure_future(notif.broadcast_event(evt))
+        notif.broadcast_event_soon(evt)
         return None
 
 
@@ -565,7 +569,7 @@ async def update_scene_description_cb(req: srpc.s.UpdateSceneDescription.Request
 
             evt = sevts.s.SceneChanged(scene.bare)
             evt.change_type = Event.Type.UPDATE_BASE
-            asyncio.ensure_future(notif.broadcast_event(evt))
+            notif.broadcast_event_soon(evt)
         return None
 
 
@@ -577,7 +581,7 @@ async def copy_scene_cb(req: srpc.s.CopyScene.Request, ui: WsClient) -> None:
 
             evt = sevts.s.SceneChanged(scene.bare)
             evt.change_type = Event.Type.UPDATE_BASE
-            asyncio.ensure_future(notif.broadcast_event(evt))
+            notif.broadcast_event_soon(evt)
 
         return None
 
@@ -706,14 +710,14 @@ async def add_virtual_collision_object_to_scene_cb(
 
         evt = sevts.o.ChangedObjectTypes([meta])
         evt.change_type = Event.Type.ADD
-        asyncio.ensure_future(notif.broadcast_event(evt))
+        notif.broadcast_event_soon(evt)
 
         obj = common.SceneObject(req.args.name, req.args.name, req.args.pose)
         scene.upsert_object(obj)  # add_object_to_scene(scene, obj) would do some unnecessary checks
 
         evt2 = sevts.s.SceneObjectChanged(obj)
         evt2.change_type = Event.Type.ADD
-        asyncio.ensure_future(notif.broadcast_event(evt2))
+        notif.broadcast_event_soon(evt2)
 
         # for a case when user created VCO of the type which already existed before (and was deleted)
         asyncio.create_task(unschedule_auto_remove(obj.type))
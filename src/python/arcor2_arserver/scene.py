@@ -17,19 +17,22 @@ from arcor2_arserver import logger
 from arcor2_arserver import notifications as notif
 from arcor2_arserver.checks import check_object, scene_problems
 from arcor2_arserver.clients import project_service as storage
-from arcor2_arserver.common import invalidate_joints_using_object_as_parent
+from arcor2_arserver.common import invalidate_joints_using_objects_as_parent
 from arcor2_arserver.helpers import ctx_write_lock
 from arcor2_arserver.lock.exceptions import CannotLock
 from arcor2_arserver.object_types.utils import remove_object_type
 from arcor2_arserver.objects_actions import get_object_types
 from arcor2_arserver_data import events as sevts
 from arcor2_arserver_data.events.common import ShowMainScreen
+from arcor2_arserver_data.events.project import OpenProject
 from arcor2_arserver_data.events.scene import OpenScene, SceneClosed, SceneObjectChanged, SceneState
 from arcor2_arserver_data.objects import ObjectTypeMeta
 
 # TODO maybe this could be property of ARServerScene(CachedScene)?
 _scene_state: SceneState = SceneState(SceneState.Data(SceneState.Data.StateEnum.Stopped))
 
+_open_event: None | tuple[tuple[tuple[str, None | datetime, None | datetime], ...], str] = None
+
 
 @dataclass
 class SceneProblems:
@@ -67,24 +70,16 @@ async def unschedule_auto_remove(obj_type: str) -> None:
 
 async def remove_scheduled() -> None:
     logger.debug(f"Going to auto-remove following types: {_objects_to_auto_remove}")
-    for ot_id in _objects_to_auto_remove:
-        if ot_id in glob.OBJECT_TYPES:
-            asyncio.create_task(delete_if_not_used(glob.OBJECT_TYPES[ot_id].meta))
+    metas = [glob.OBJECT_TYPES[ot_id].meta for ot_id in _objects_to_auto_remove if ot_id in glob.OBJECT_TYPES]
     _objects_to_auto_remove.clear()
 
+    if metas:
+        asyncio.create_task(delete_if_not_used(metas))
 
-async def delete_if_not_used(meta: ObjectTypeMeta) -> None:
-    if meta.base != VirtualCollisionObject.__name__:
-        logger.debug(f"{meta.type} is not a VCO!")
-        return
-
-    assert meta.object_model
-    assert meta.type == meta.object_model.model().id, f"meta.type={meta.type}, model.id={meta.object_model.model().id}"
 
-    async for scn in scenes():
-        if any(scn.objects_of_type(meta.type)):
-            logger.debug(f"Not auto-removing VCO {meta.type} as it is used in scene {scn.name}.")
-            return
+async def _auto_remove(meta: ObjectTypeMeta) -> bool:
+    """Returns False if the type was removed in the meantime (e.g. by another
+    task)."""
 
     logger.debug(f"Auto-removing VCO {meta.type} as it is not used in any scene.")
 
@@ -97,11 +92,59 @@ async def delete_if_not_used(meta: ObjectTypeMeta) -> None:
     except Arcor2Exception as e:
         logger.warn(str(e))
 
-    del glob.OBJECT_TYPES[meta.type]
+    if glob.OBJECT_TYPES.pop(meta.type, None) is None:
+        logger.debug(f"{meta.type} was already removed.")
+        return False
 
     logger.debug(f"Auto-removing {meta.type} done... {meta}")
+    return True
+
+
+async def delete_if_not_used(metas: list[ObjectTypeMeta]) -> None:
+    """Removes VCOs that are not used in any scene.
+
+    Scenes are gone through just once for all the given types.
+    """
+
+    vcos: dict[str, ObjectTypeMeta] = {}
+
+    for meta in metas:
+        if meta.base != VirtualCollisionObject.__name__:
+            logger.debug(f"{meta.type} is not a VCO!")
+            continue
+
+        assert meta.object_model
+        model_id = meta.object_model.model().id
+        assert meta.type == model_id, f"meta.type={meta.type}, model.id={model_id}"
+
+        vcos[meta.type] = meta
+
+    if not vcos:
+        return
+
+    async for scn in scenes():
+        for obj_type in scn.object_types & vcos.keys():
+            logger.debug(f"Not auto-removing VCO {obj_type} as it is used in scene {scn.name}.")
+            del vcos[obj_type]
+
+        if not vcos:
+            return
 
-    evtr = sevts.o.ChangedObjectTypes([meta])
+    # failure to remove one type should not prevent notifying about the others
+    results = await asyncio.gather(*[_auto_remove(meta) for meta in vcos.values()], return_exceptions=True)
+
+    removed: list[ObjectTypeMeta] = []
+
+    for meta, res in zip(vcos.values(), results):
+        if isinstance(res, BaseException):
+            logger.error(f"Failed to auto-remove {meta.type}: {res}")
+        elif res:
+            removed.append(meta)
+
+    if not removed:
+        return
+
+    evtr = sevts.o.ChangedObjectTypes(removed)
     evtr.change_type = Event.Type.REMOVE
     await notif.broadcast_event(evtr)
 
@@ -111,12 +154,12 @@ async def save_scene(scene: None | UpdateableCachedScene = None) -> None:
         scene = glob.LOCK.scene_or_exception()
 
     scene.modified = await storage.update_scene(scene)
-    asyncio.ensure_future(notif.broadcast_event(sevts.s.SceneSaved()))
+    notif.broadcast_event_soon(sevts.s.SceneSaved())
     asyncio.create_task(remove_scheduled())
 
-    for obj_id in glob.OBJECTS_WITH_UPDATED_POSE:
-        asyncio.ensure_future(invalidate_joints_using_object_as_parent(scene.object(obj_id)))
-    glob.OBJECTS_WITH_UPDATED_POSE.clear()
+    if glob.OBJECTS_WITH_UPDATED_POSE:
+        asyncio.ensure_future(invalidate_joints_using_objects_as_parent(set(glob.OBJECTS_WITH_UPDATED_POSE)))
+        glob.OBJECTS_WITH_UPDATED_POSE.clear()
 
 
 def get_ot_modified(ots: set[str]) -> dict[str, datetime]:
@@ -202,7 +245,7 @@ async def update_scene_object_pose(
 async def set_scene_state(state: SceneState.Data.StateEnum, message: None | str = None) -> None:
     global _scene_state
     _scene_state = SceneState(SceneState.Data(state, message))
-    asyncio.create_task(notif.broadcast_event(_scene_state))
+    notif.broadcast_event_soon(_scene_state)
 
 
 def get_scene_state() -> SceneState:
@@ -227,8 +270,33 @@ def ensure_scene_started() -> None:
         raise Arcor2Exception("Scene offline.")
 
 
-async def notify_scene_opened(evt: OpenScene) -> None:
-    await notif.broadcast_event(evt)
+def open_event_json() -> str:
+    """Returns serialized OpenProject/OpenScene event for the opened
+    project/scene.
+
+    The event is cached until the scene/project is modified, so it is
+    serialized just once for broadcasting and for newly connected UIs.
+    """
+
+    global _open_event
+
+    assert glob.LOCK.scene
+
+    key = tuple((c.id, c.modified, c.int_modified) for c in (glob.LOCK.scene, glob.LOCK.project) if c)
+
+    if _open_event is None or _open_event[0] != key:
+        if glob.LOCK.project:
+            evt: Event = OpenProject(OpenProject.Data(glob.LOCK.scene.scene, glob.LOCK.project.project))
+        else:
+            evt = OpenScene(OpenScene.Data(glob.LOCK.scene.scene))
+
+        _open_event = key, evt.to_json()
+
+    return _open_event[1]
+
+
+async def notify_scene_opened() -> None:
+    glob.USERS.broadcast(open_event_json())
     ss = get_scene_state()
     assert ss.data.state == ss.Data.StateEnum.Stopped
     await notif.broadcast_event(ss)
@@ -55,10 +55,7 @@ async def handle_manager_incoming_messages(manager_client) -> None:
                 continue
 
             if "event" in msg:
-                if glob.USERS.interfaces:
-                    await asyncio.gather(
-                        *[ws_server.send_json_to_client(intf, message) for intf in glob.USERS.interfaces]
-                    )
+                glob.USERS.broadcast(message)
 
                 try:
                     evt = event_mapping[msg["event"]].from_dict(msg)
@@ -103,7 +100,13 @@ async def handle_manager_incoming_messages(manager_client) -> None:
                 # TODO handle potential errors
                 rpc_cls = rpc_mapping[msg["response"]]
                 resp = rpc_cls.Response.from_dict(msg)
-                exe.MANAGER_RPC_RESPONSES[resp.id].put_nowait(resp)
+                fut = exe.MANAGER_RPC_RESPONSES.get(resp.id)
+
+                # the request might be already cancelled
+                if fut is not None and not fut.done():
+                    fut.set_result(resp)
+                else:
+                    logger.warning(f"Dropping response {resp.response} (id: {resp.id}), nobody waits for it.")
 
     except websockets.exceptions.ConnectionClosed as e:
         logger.error(f"Connection to manager closed. {str(e)}")
@@ -154,13 +157,14 @@ async def _initialize_server() -> None:
         rpc_dict=RPC_DICT,
         event_dict=EVENT_DICT,
         verbose=glob.VERBOSE,
+        send=glob.USERS.send,
     )
 
     if __debug__:
         logger.warn("Development mode. The service will shutdown on any unhandled exception.")
 
     logger.info(f"ARServer {arcor2_arserver.version()} " f"(API version {arcor2_arserver_data.version()}) initialized.")
-    await asyncio.wait([websockets.server.serve(bound_handler, "0.0.0.0", glob.PORT)])
+    await websockets.server.serve(bound_handler, "0.0.0.0", glob.PORT)
     asyncio.create_task(run_lock_notification_worker())
 
 
@@ -172,20 +176,15 @@ async def register(websocket: WsClient) -> None:
     logger.info("Registering new ui")
     glob.USERS.add_interface(websocket)
 
-    if glob.LOCK.project:
-        assert glob.LOCK.scene
-        await notif.event(
-            websocket, evts.p.OpenProject(evts.p.OpenProject.Data(glob.LOCK.scene.scene, glob.LOCK.project.project))
-        )
-    elif glob.LOCK.scene:
-        await notif.event(websocket, evts.s.OpenScene(evts.s.OpenScene.Data(glob.LOCK.scene.scene)))
+    if glob.LOCK.scene:  # project might be opened as well
+        glob.USERS.send(websocket, scene.open_event_json())
     elif glob.PACKAGE_INFO:
         # this can't be done in parallel - ui expects this order of events
-        await websocket.send(events.PackageState(glob.PACKAGE_STATE).to_json())
-        await websocket.send(events.PackageInfo(glob.PACKAGE_INFO).to_json())
+        await notif.event(websocket, events.PackageState(glob.PACKAGE_STATE))
+        await notif.event(websocket, events.PackageInfo(glob.PACKAGE_INFO))
 
         if glob.ACTION_STATE_BEFORE:
-            await websocket.send(events.ActionStateBefore(glob.ACTION_STATE_BEFORE).to_json())
+            await notif.event(websocket, events.ActionStateBefore(glob.ACTION_STATE_BEFORE))
     else:
         assert glob.MAIN_SCREEN
         await notif.event(websocket, evts.c.ShowMainScreen(glob.MAIN_SCREEN))
@@ -301,6 +300,13 @@ def main() -> None:
         const=True,
         default=env.get_bool("ARCOR2_ARSERVER_ASYNCIO_DEBUG"),
     )
+    parser.add_argument(
+        "--uvloop",
+        help="Use uvloop instead of the default asyncio event loop (has to be installed).",
+        action="store_const",
+        const=True,
+        default=env.get_bool("ARCOR2_ARSERVER_UVLOOP"),
+    )
     parser.add_argument("--openapi", action="store_true", help="Prints OpenAPI models and exits.")
 
     args = parser.parse_args()
@@ -312,13 +318,27 @@ def main() -> None:
     logger.level = args.debug
     glob.VERBOSE = args.verbose
 
+    if args.uvloop:
+        import uvloop  # optional dependency
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        asyncio.set_event_loop(asyncio.new_event_loop())  # uvloop's policy does not create the loop implicitly
+
     loop = asyncio.get_event_loop()
     loop.set_debug(enabled=args.asyncio_debug)
     loop.set_exception_handler(ws_server.custom_exception_handler)
 
     compile_json_schemas()
 
-    run(aio_main(), loop=loop)
+    # otherwise, validator of each RPC request would be compiled on its first use (takes a few ms, blocks the loop)
+    for rpc_cls, _ in RPC_DICT.values():
+        try:
+            rpc_cls.Request.from_dict({})
+        except ValidationError:
+            pass
+
+    # calls to objects (e.g. robots) are mostly I/O-bound and some of them might block for a long time
+    run(aio_main(), loop=loop, executor_workers=max(env.get_int("ARCOR2_ARSERVER_EXECUTOR_WORKERS", 64), 1))
 
     shutil.rmtree(settings.OBJECT_TYPE_PATH)
 
@@ -2,3 +2,6 @@ import tempfile
 
 OBJECT_TYPE_PATH = tempfile.mkdtemp()
 OBJECT_TYPE_MODULE = "arcor2_object_types"
+
+# limits number of concurrent requests to the Project service
+MAX_PARALLEL_DOWNLOADS = 32
@@ -104,6 +104,33 @@ def test_scene_basic_rpcs(start_processes: None, ars: ARServer) -> None:
     assert not list_of_scenes_2.data
 
 
+def test_rename_opened_scene(start_processes: None, ars: ARServer, scene: Scene) -> None:
+    new_name = "Renamed scene"
+
+    assert ars.call_rpc(rpc.s.OpenScene.Request(get_id(), IdArgs(scene.id)), rpc.s.OpenScene.Response).result
+    event(ars, events.s.OpenScene)
+    event(ars, events.s.SceneState)
+
+    lock_object(ars, scene.id)
+
+    assert ars.call_rpc(
+        rpc.s.RenameScene.Request(get_id(), rpc.s.RenameArgs(scene.id, new_name)), rpc.s.RenameScene.Response
+    ).result
+
+    scene_changed_evt = event(ars, events.s.SceneChanged)
+    assert scene_changed_evt.data
+    assert scene_changed_evt.data.name == new_name
+
+    event(ars, events.lk.ObjectsUnlocked)
+
+    # newly connected UI should get the scene with the new name
+    with ARServer(ars_connection_str(), timeout=10, event_mapping=event_mapping) as ars_2:
+        open_scene_evt = event(ars_2, events.s.OpenScene)
+        assert open_scene_evt.data
+        assert open_scene_evt.data.scene.id == scene.id
+        assert open_scene_evt.data.scene.name == new_name
+
+
 def test_update_object_pose(start_processes: None, ars: ARServer) -> None:
     upload_def(Box, BoxModel("Box", 0.1, 0.1, 0.1))
     upload_def(DummyMultiArmRobot)
@@ -1,9 +1,12 @@
 import asyncio
+from typing import KeysView
 
 from websockets.exceptions import WebSocketException
 from websockets.server import WebSocketServerProtocol as WsClient
 
+from arcor2.data.events import Event
 from arcor2.exceptions import Arcor2Exception
+from arcor2.ws_server import ClientWriter
 
 
 class UsersException(Arcor2Exception):
@@ -14,7 +17,7 @@ class Users:
     __slots__ = ("_interfaces", "_users_ui", "_ui_users")
 
     def __init__(self) -> None:
-        self._interfaces: set[WsClient] = set()
+        self._interfaces: dict[WsClient, ClientWriter] = {}
         self._users_ui: dict[str, WsClient] = {}
         self._ui_users: dict[WsClient, str] = {}
 
@@ -24,11 +27,30 @@ class Users:
         assert set(self._ui_users).issubset(self._interfaces)
 
     @property
-    def interfaces(self) -> set[WsClient]:
-        return self._interfaces
+    def interfaces(self) -> KeysView[WsClient]:
+        return self._interfaces.keys()
 
     def add_interface(self, ui: WsClient) -> None:
-        self._interfaces.add(ui)
+        self._interfaces[ui] = ClientWriter(ui)
+
+    def send(self, ui: WsClient, data: str) -> None:
+        """Queues a message for the ui (if still connected)."""
+
+        if writer := self._interfaces.get(ui):
+            writer.put(data)
+
+    def send_event(self, ui: WsClient, event: Event) -> None:
+        """Queues an event for the ui, it is serialized only if the ui is still
+        connected."""
+
+        if writer := self._interfaces.get(ui):
+            writer.put(event.to_json())
+
+    def broadcast(self, data: str) -> None:
+        """Queues a message for all known interfaces."""
+
+        for writer in self._interfaces.values():
+            writer.put(data)
 
     async def login(self, user_name: str, ui: WsClient) -> None:
         self._assert_consistency()
@@ -66,7 +88,7 @@ class Users:
         self._assert_consistency()
 
         try:
-            self._interfaces.remove(ui)
+            self._interfaces.pop(ui).stop()
         except KeyError:
             raise UsersException("Unknown ui.")
 
@@ -412,8 +412,7 @@ async def send_to_clients(event: events.Event) -> None:
         logger.error(f"Script raised {event.data.type}. {event.data.message}")
 
     if CLIENTS:
-        data = event.to_json()
-        await asyncio.wait([client.send(data) for client in CLIENTS])
+        ws_server.send_json_to_clients(CLIENTS, event.to_json())
 
 
 async def register(websocket: WsClient) -> None: